@@ -15,36 +15,176 @@ Usage:
     python synthesize.py my_text.md                # uses a custom markdown file
     python synthesize.py -o demo                   # output as demo.wav / demo.mp3
     python synthesize.py my_text.md -o recording   # custom input + output name
+    python synthesize.py --no-cache                # ignore cached voice type and audio
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import json
+import mmap
 import os
 import sys
 import re
+import shutil
+import tempfile
+import threading
+import types
+
+# Shared HTTP session so the voice-type probe and the trial synthesis call
+# reuse the same pooled keep-alive connection (and TLS session) to Azure.
+# Created on first use so that requests is only imported when needed.
+_SESSION = None
+
+# Guards the one-time .env load shared by main and the background probe
+_ENV_LOCK = threading.Lock()
+_ENV_LOADED = False
+
+# Per-user cache directory; the voice kind detected for each speaker profile
+# is remembered here so later runs can skip the probe request, and SDK
+# synthesis output is stored under a hash of its SSML
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tts-personal-voice")
+_VOICE_KIND_CACHE = os.path.join(_CACHE_DIR, "voice_kind.json")
+
+# Markdown inputs at least this large are memory-mapped instead of read
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Chunk size for streaming audio responses, and buffer size for the output file
+_STREAM_CHUNK_SIZE = 64 * 1024
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Markdown stripping patterns, compiled once at import time
+_RE_IMAGE = re.compile(r"!\[.*?\]\(.*?\)")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_RE_HEADING = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_RE_BOLD = re.compile(r"\*{1,3}(.*?)\*{1,3}")
+_RE_UNDER = re.compile(r"_{1,3}(.*?)_{1,3}")
+_RE_ICODE = re.compile(r"`([^`]+)`")
+_RE_CBLOCK = re.compile(r"```[\s\S]*?```")
+_RE_HR = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_RE_BLANK = re.compile(r"\n{3,}")
+
+# scriptOrder varies by locale in the trial API
+# Known values from Speech Studio: en-US=11, es-ES=13
+_SCRIPT_ORDER_BY_LOCALE = types.MappingProxyType({
+    "en-US": 11, "en-GB": 11, "en-AU": 11, "en-IN": 11,
+    "es-ES": 13, "es-MX": 13,
+    "fr-FR": 12, "de-DE": 12, "it-IT": 12,
+    "ja-JP": 14, "ko-KR": 14, "zh-CN": 14,
+    "pt-BR": 13,
+})
+
+# Prosody adjustments applied on top of each speech style (SDK path)
+_PROSODY_PRESETS = types.MappingProxyType({
+    "Cheerful":    {"rate": "+8%",  "pitch": "+5%"},
+    "Excited":     {"rate": "+12%", "pitch": "+8%"},
+    "Friendly":    {"rate": "+5%",  "pitch": "+3%"},
+    "Enthusiastic":{"rate": "+10%", "pitch": "+6%"},
+})
+
+# SSML templates for the SDK path; fields are escaped before formatting
+_SSML_TMPL_PLAIN = (
+    "<speak version='1.0' xml:lang='{lang}' "
+    "xmlns='http://www.w3.org/2001/10/synthesis' "
+    "xmlns:mstts='http://www.w3.org/2001/mstts'>"
+    "<voice name='DragonLatestNeural'>"
+    "<mstts:ttsembedding speakerProfileId='{spid}'/>"
+    "<mstts:express-as style='{style}'>"
+    "<lang xml:lang='{lang}'>{text}</lang>"
+    "</mstts:express-as>"
+    "</voice>"
+    "</speak>"
+)
+_SSML_TMPL_PROSODY = _SSML_TMPL_PLAIN.replace(
+    "<lang xml:lang='{lang}'>{text}</lang>",
+    "<prosody rate='{rate}' pitch='{pitch}'><lang xml:lang='{lang}'>{text}</lang></prosody>",
+)
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+        _SESSION = session
+    return _SESSION
+
+
+def _load_env():
+    """
+    Load the .env file into os.environ (once per process). Locked because the
+    background voice-type probe and load_config may both call it first.
+    """
+    global _ENV_LOADED
+    with _ENV_LOCK:
+        if not _ENV_LOADED:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _ENV_LOADED = True
+
 
-import requests
-from dotenv import load_dotenv
+def _read_credentials():
+    """
+    Read the required Azure credentials from the environment.
+    Returns (credentials, missing), where missing is the first key that is
+    unset or still a template placeholder, or None if all are set.
+    """
+    env = os.environ
+    credentials = {}
+    for key in ("SPEECH_KEY", "SPEECH_REGION", "SPEAKER_PROFILE_ID"):
+        value = env.get(key)
+        if not value or value.startswith("your_"):
+            return credentials, key
+        credentials[key] = value
+    return credentials, None
 
 
+def _read_voice_kind(warn: bool = False) -> str:
+    """
+    Return VOICE_KIND from the environment ("trial"/"full"), or "" to auto-detect.
+    Any other value also falls back to auto-detect, with a warning if warn is set.
+    """
+    voice_kind = os.environ.get("VOICE_KIND", "").strip().lower()
+    if voice_kind in ("trial", "full", ""):
+        return voice_kind
+    if warn:
+        print(f"WARNING: Ignoring invalid VOICE_KIND '{voice_kind}' (expected 'trial' or 'full'); auto-detecting.")
+    return ""
+
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from .env file."""
-    load_dotenv()
+    """
+    Load configuration from .env file.
+    The result is cached and read-only; callers that need overrides should
+    build a new dict from it.
+    """
+    _load_env()
+    env = os.environ
 
-    required = ["SPEECH_KEY", "SPEECH_REGION", "SPEAKER_PROFILE_ID"]
-    config = {}
-    for key in required:
-        value = os.getenv(key)
-        if not value or value.startswith("your_"):
-            print(f"ERROR: '{key}' is not set in .env file. Please fill in your actual value.")
-            sys.exit(1)
-        config[key] = value
+    config, missing = _read_credentials()
+    if missing:
+        print(f"ERROR: '{missing}' is not set in .env file. Please fill in your actual value.")
+        sys.exit(1)
 
-    config["SPEECH_LANGUAGE"] = os.getenv("SPEECH_LANGUAGE", "en-US")
-    config["SPEECH_STYLE"] = os.getenv("SPEECH_STYLE", "Cheerful")
-    config["OUTPUT_FORMAT"] = os.getenv("OUTPUT_FORMAT", "wav").lower()
-    config["OUTPUT_FILENAME"] = os.getenv("OUTPUT_FILENAME", "output")
+    config["SPEECH_LANGUAGE"] = env.get("SPEECH_LANGUAGE", "en-US")
+    config["SPEECH_STYLE"] = env.get("SPEECH_STYLE", "Cheerful")
+    config["OUTPUT_FORMAT"] = env.get("OUTPUT_FORMAT", "wav").lower()
+    config["OUTPUT_FILENAME"] = env.get("OUTPUT_FILENAME", "output")
+    config["VOICE_KIND"] = _read_voice_kind(warn=True)
 
-    return config
+    return types.MappingProxyType(config)
 
 
 def read_markdown(file_path: str) -> str:
@@ -56,26 +196,36 @@ def read_markdown(file_path: str) -> str:
         print(f"ERROR: Input file '{file_path}' not found.")
         sys.exit(1)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        text = f.read()
+    # Large files are decoded straight from a memory map, avoiding an
+    # intermediate bytes copy of the whole file; others use a plain text read
+    if os.path.getsize(file_path) >= _MMAP_THRESHOLD:
+        with open(file_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+        # Normalize CRLF/CR line endings like text mode would
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+    else:
+        with open(file_path, "r", encoding="utf-8") as f:
+            text = f.read()
 
     # Remove images ![alt](url)
-    text = re.sub(r"!\[.*?\]\(.*?\)", "", text)
+    text = _RE_IMAGE.sub("", text)
     # Convert links [text](url) -> text
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+    text = _RE_LINK.sub(r"\1", text)
     # Remove heading markers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = _RE_HEADING.sub("", text)
     # Remove bold/italic markers
-    text = re.sub(r"\*{1,3}(.*?)\*{1,3}", r"\1", text)
-    text = re.sub(r"_{1,3}(.*?)_{1,3}", r"\1", text)
+    text = _RE_BOLD.sub(r"\1", text)
+    text = _RE_UNDER.sub(r"\1", text)
+    # Remove code blocks (before inline code, which would otherwise unwrap them)
+    text = _RE_CBLOCK.sub("", text)
     # Remove inline code
-    text = re.sub(r"`([^`]+)`", r"\1", text)
-    # Remove code blocks
-    text = re.sub(r"```[\s\S]*?```", "", text)
+    text = _RE_ICODE.sub(r"\1", text)
     # Remove horizontal rules
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
+    text = _RE_HR.sub("", text)
     # Collapse multiple blank lines into one
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_BLANK.sub("\n\n", text)
 
     return text.strip()
 
@@ -105,17 +255,8 @@ def synthesize_trial(config: dict, text: str) -> None:
         "Content-Type": "application/json",
     }
 
-    # scriptOrder varies by locale in the trial API
-    # Known values from Speech Studio: en-US=11, es-ES=13
-    # Use a lookup with a fallback
-    SCRIPT_ORDER_BY_LOCALE = {
-        "en-US": 11, "en-GB": 11, "en-AU": 11, "en-IN": 11,
-        "es-ES": 13, "es-MX": 13,
-        "fr-FR": 12, "de-DE": 12, "it-IT": 12,
-        "ja-JP": 14, "ko-KR": 14, "zh-CN": 14,
-        "pt-BR": 13,
-    }
-    script_order = SCRIPT_ORDER_BY_LOCALE.get(language, 11)
+    # scriptOrder varies by locale in the trial API; fall back to en-US's value
+    script_order = _SCRIPT_ORDER_BY_LOCALE.get(language, 11)
 
     body = {
         "model": model_url,
@@ -133,119 +274,164 @@ def synthesize_trial(config: dict, text: str) -> None:
     print(f"  Text length:        {len(text)} characters")
     print()
 
-    response = requests.post(synth_url, headers=headers, json=body, timeout=120)
+    # Stream the audio straight to disk instead of buffering it in memory
+    with _get_session().post(synth_url, headers=headers, json=body, timeout=120, stream=True) as response:
+        # Decide from the status line and Content-Type alone; only an error
+        # body is ever read into memory and parsed
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and content_type.startswith("audio/"):
+            size = 0
+            with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    size += f.write(chunk)
+            size_kb = size / 1024
+            print(f"SUCCESS: Audio saved to '{output_file}' ({size_kb:.1f} KB)")
+        else:
+            _report_trial_error(response.status_code, response.text)
+            sys.exit(1)
+
 
-    if response.status_code == 200 and "audio" in response.headers.get("Content-Type", ""):
-        with open(output_file, "wb") as f:
-            f.write(response.content)
-        size_kb = len(response.content) / 1024
-        print(f"SUCCESS: Audio saved to '{output_file}' ({size_kb:.1f} KB)")
-    else:
-        print(f"ERROR: Synthesis failed (HTTP {response.status_code})")
-        try:
-            err = response.json()
-            msg = err.get("error", {}).get("message", response.text[:300])
-            inner = err.get("error", {}).get("innererror", {}).get("message", "")
-            print(f"  Message: {msg}")
-            if inner:
-                print(f"  Detail:  {inner}")
-        except Exception:
-            print(f"  Response: {response.text[:300]}")
-        sys.exit(1)
+def _report_trial_error(status: int, body: str) -> None:
+    """Print the error returned by the trial synthesis API."""
+    print(f"ERROR: Synthesis failed (HTTP {status})")
+    try:
+        err = json.loads(body)
+        msg = err.get("error", {}).get("message", body[:300])
+        inner = err.get("error", {}).get("innererror", {}).get("message", "")
+        print(f"  Message: {msg}")
+        if inner:
+            print(f"  Detail:  {inner}")
+    except Exception:
+        print(f"  Response: {body[:300]}")
+
+
+def _build_ssml(lang: str, spid: str, style: str, text: str) -> str:
+    """Build the SSML for the SDK path, with optional prosody adjustments."""
+    import html as _html
+
+    prosody = _PROSODY_PRESETS.get(style)
+    fields = {
+        "lang": lang,
+        "spid": _html.escape(spid),
+        "style": _html.escape(style),
+        "text": _html.escape(text, quote=False),
+    }
+    if prosody:
+        return _SSML_TMPL_PROSODY.format_map({**fields, **prosody})
+    return _SSML_TMPL_PLAIN.format_map(fields)
 
 
-def synthesize_sdk(config: dict, text: str) -> None:
+def synthesize_sdk(config: dict, text: str, use_cache: bool = True) -> None:
     """
     Synthesize text using the Speech SDK (for non-trial personal voices).
     Requires a proper speakerProfileId from the Custom Voice REST API.
+    Audio for SSML that was already synthesized is reused from the cache
+    unless use_cache is False; fresh results always refresh the cache.
     """
+    output_format = "mp3" if config["OUTPUT_FORMAT"] == "mp3" else "wav"
+    output_file = f"{config['OUTPUT_FILENAME']}.{output_format}"
+
+    lang = config["SPEECH_LANGUAGE"]
+    spid = config["SPEAKER_PROFILE_ID"]
+    style = config.get("SPEECH_STYLE", "Cheerful")
+    ssml = _build_ssml(lang, spid, style, text)
+
+    # The SSML covers text, language, style, prosody and speaker profile
+    cache_key = hashlib.blake2b(ssml.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = os.path.join(_CACHE_DIR, f"{cache_key}.{output_format}")
+
+    print("Synthesizing with Personal Voice (SDK)...")
+    print(f"  Region:             {config['SPEECH_REGION']}")
+    print(f"  Language:           {lang}")
+    print(f"  Speaker Profile ID: {spid}")
+    print(f"  Style:              {style}")
+    print(f"  Output file:        {output_file}")
+    print(f"  Text length:        {len(text)} characters")
+    print()
+
+    if use_cache and os.path.isfile(cache_file):
+        shutil.copyfile(cache_file, output_file)
+        size_kb = os.path.getsize(output_file) / 1024
+        print(f"SUCCESS: Audio saved to '{output_file}' ({size_kb:.1f} KB, from cache)")
+        return
+
     try:
         import azure.cognitiveservices.speech as speechsdk
     except ImportError:
         print("Azure Speech SDK not found. Install with: pip install azure-cognitiveservices-speech")
         sys.exit(1)
 
-    import html as _html
-
     speech_config = speechsdk.SpeechConfig(
         subscription=config["SPEECH_KEY"],
         region=config["SPEECH_REGION"]
     )
 
-    if config["OUTPUT_FORMAT"] == "mp3":
+    if output_format == "mp3":
         speech_config.set_speech_synthesis_output_format(
             speechsdk.SpeechSynthesisOutputFormat.Audio24Khz160KBitRateMonoMp3
         )
-        output_file = f"{config['OUTPUT_FILENAME']}.mp3"
     else:
         speech_config.set_speech_synthesis_output_format(
             speechsdk.SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm
         )
-        output_file = f"{config['OUTPUT_FILENAME']}.wav"
 
-    file_config = speechsdk.audio.AudioOutputConfig(filename=output_file)
+    # No audio config: audio is pulled from the result stream and written
+    # to disk as it arrives, overlapping synthesis with the file write
     synthesizer = speechsdk.SpeechSynthesizer(
         speech_config=speech_config,
-        audio_config=file_config
+        audio_config=None
     )
 
-    lang = config["SPEECH_LANGUAGE"]
-    spid = config["SPEAKER_PROFILE_ID"]
-    style = config.get("SPEECH_STYLE", "Cheerful")
-    escaped_text = _html.escape(text)
-
-    # Build the inner content with optional prosody adjustments
-    PROSODY_PRESETS = {
-        "Cheerful":    {"rate": "+8%",  "pitch": "+5%"},
-        "Excited":     {"rate": "+12%", "pitch": "+8%"},
-        "Friendly":    {"rate": "+5%",  "pitch": "+3%"},
-        "Enthusiastic":{"rate": "+10%", "pitch": "+6%"},
-    }
-    prosody = PROSODY_PRESETS.get(style)
-    if prosody:
-        inner = (f"<prosody rate='{prosody['rate']}' pitch='{prosody['pitch']}'>"
-                 f"<lang xml:lang='{lang}'>{escaped_text}</lang>"
-                 f"</prosody>")
-    else:
-        inner = f"<lang xml:lang='{lang}'>{escaped_text}</lang>"
-
-    ssml = (
-        f"<speak version='1.0' xml:lang='{lang}' "
-        f"xmlns='http://www.w3.org/2001/10/synthesis' "
-        f"xmlns:mstts='http://www.w3.org/2001/mstts'>"
-        f"<voice name='DragonLatestNeural'>"
-        f"<mstts:ttsembedding speakerProfileId='{_html.escape(spid)}'/>"
-        f"<mstts:express-as style='{_html.escape(style)}'>"
-        f"{inner}"
-        f"</mstts:express-as>"
-        f"</voice>"
-        f"</speak>"
-    )
+    result = synthesizer.start_speaking_ssml_async(ssml).get()
 
-    print("Synthesizing with Personal Voice (SDK)...")
-    print(f"  Region:             {config['SPEECH_REGION']}")
-    print(f"  Language:           {lang}")
-    print(f"  Speaker Profile ID: {spid}")
-    print(f"  Style:              {style}")
-    print(f"  Output file:        {output_file}")
-    print(f"  Text length:        {len(text)} characters")
-    print()
-
-    result = synthesizer.speak_ssml_async(ssml).get()
-
-    if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-        print(f"SUCCESS: Audio saved to '{output_file}'")
-        print(f"  Result ID: {result.result_id}")
-    elif result.reason == speechsdk.ResultReason.Canceled:
+    cancellation = None
+    if result.reason == speechsdk.ResultReason.Canceled:
         cancellation = result.cancellation_details
+    else:
+        stream = speechsdk.AudioDataStream(result)
+        buffer = bytes(_STREAM_CHUNK_SIZE)
+        view = memoryview(buffer)
+        size = 0
+        with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            filled = stream.read_data(buffer)
+            while filled:
+                size += f.write(view[:filled])
+                filled = stream.read_data(buffer)
+        if stream.status == speechsdk.StreamStatus.Canceled:
+            cancellation = stream.cancellation_details
+            os.remove(output_file)
+
+    if cancellation is None:
+        size_kb = size / 1024
+        print(f"SUCCESS: Audio saved to '{output_file}' ({size_kb:.1f} KB)")
+        print(f"  Result ID: {result.result_id}")
+        # Copy to a unique temporary name first so an interrupted copy is never
+        # picked up as a cache hit and concurrent runs don't clobber each other
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+            os.close(fd)
+            try:
+                shutil.copyfile(output_file, tmp_file)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                os.remove(tmp_file)
+                raise
+        except OSError:
+            pass
+    else:
         print(f"CANCELED: {cancellation.reason}")
         if cancellation.reason == speechsdk.CancellationReason.Error:
             print(f"  Error details: {cancellation.error_details}")
         sys.exit(1)
 
 
-def is_trial_voice(config: dict) -> bool:
-    """Check if the speaker profile ID corresponds to a trial voice."""
+def _probe_voice_kind(config: dict):
+    """
+    Ask the trial API whether the speaker profile is a trial voice.
+    Returns "trial" or "full", or None if the answer is not conclusive
+    (network error or an unexpected status code).
+    """
     region = config["SPEECH_REGION"]
     key = config["SPEECH_KEY"]
     speaker_id = config["SPEAKER_PROFILE_ID"]
@@ -256,10 +442,86 @@ def is_trial_voice(config: dict) -> bool:
     )
     headers = {"Ocp-Apim-Subscription-Key": key}
     try:
-        r = requests.get(url, headers=headers, timeout=10)
-        return r.status_code == 200
+        r = _get_session().get(url, headers=headers, timeout=10)
     except Exception:
-        return False
+        return None
+    if r.status_code == 200:
+        return "trial"
+    if r.status_code == 404:
+        return "full"
+    return None
+
+
+def _load_voice_kind_cache() -> dict:
+    """Load the on-disk {"region/speaker_id": kind} cache, or an empty dict."""
+    try:
+        with open(_VOICE_KIND_CACHE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def detect_voice_kind(config: dict, use_cache: bool = True) -> str:
+    """
+    Return "trial" or "full" for the configured speaker profile.
+    Uses the cached result from a previous run when available (unless
+    use_cache is False), otherwise probes the trial API and caches
+    conclusive answers.
+    """
+    # Keyed by region too, so a probe against the wrong region is not
+    # reused once the config is fixed
+    cache_key = f"{config['SPEECH_REGION']}/{config['SPEAKER_PROFILE_ID']}"
+    cache = _load_voice_kind_cache()
+    kind = cache.get(cache_key) if use_cache else None
+    if kind in ("trial", "full"):
+        return kind
+
+    kind = _probe_voice_kind(config)
+    if kind is None:
+        return "full"
+
+    cache[cache_key] = kind
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_VOICE_KIND_CACHE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+    return kind
+
+
+def _detect_voice_kind_from_env(use_cache: bool = True):
+    """
+    Detect the voice kind straight from the environment, without the full
+    load_config validation, so it can run in the background from the start.
+    Returns None if VOICE_KIND is configured or the credentials are not set
+    (load_config reports that).
+    """
+    _load_env()
+    credentials, missing = _read_credentials()
+    if missing or _read_voice_kind():
+        return None
+    return detect_voice_kind(credentials, use_cache=use_cache)
+
+
+def _run_in_background(fn) -> concurrent.futures.Future:
+    """
+    Run fn in a daemon thread and return a Future for its result.
+    Being a daemon, the thread never delays exit if its result is not needed.
+    """
+    future = concurrent.futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 def main():
@@ -276,8 +538,18 @@ def main():
         default=None,
         help="Output file name without extension (default: from .env OUTPUT_FILENAME)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cached voice type and audio and fetch them again (the cache is refreshed)"
+    )
     args = parser.parse_args()
 
+    # Start the voice-type probe now; it runs while the input is processed
+    voice_kind_future = _run_in_background(
+        functools.partial(_detect_voice_kind_from_env, use_cache=not args.no_cache)
+    )
+
     input_file = args.input
     print(f"Reading text from: {input_file}")
     text = read_markdown(input_file)
@@ -295,16 +567,24 @@ def main():
 
     # Override output filename if provided via CLI
     if args.output:
-        config["OUTPUT_FILENAME"] = args.output
+        config = {**config, "OUTPUT_FILENAME": args.output}
 
-    # Auto-detect whether this is a trial voice or a full personal voice
-    print("Checking voice type...")
-    if is_trial_voice(config):
+    # Use VOICE_KIND from .env if set, otherwise auto-detect whether this is
+    # a trial voice or a full personal voice
+    voice_kind = config["VOICE_KIND"]
+    if not voice_kind:
+        print("Checking voice type...")
+        try:
+            voice_kind = voice_kind_future.result(timeout=15) or "full"
+        except concurrent.futures.TimeoutError:
+            # The probe runs on a daemon thread, so it does not hold up exit
+            voice_kind = "full"
+    if voice_kind == "trial":
         print("Detected: Trial personal voice\n")
         synthesize_trial(config, text)
     else:
         print("Detected: Full personal voice (using SDK)\n")
-        synthesize_sdk(config, text)
+        synthesize_sdk(config, text, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":